@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import functools
 import logging
 import re
 from typing import Final
 
 from . import const
+from .error import JvcProjectorCommandError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,13 +38,77 @@ REMOTE: Final = "RC"
 
 AUTH_SALT: Final = "JVCKWPJ"
 
+Formatter = list | dict | Callable
+Decoder = (
+    tuple[int, dict[str, str | None]]
+    | tuple[re.Pattern[str], Callable[[re.Match[str]], str]]
+)
+
+# Splits a formatter pattern into its opcode prefix, optional opcode
+# alternation group and value capture tail, e.g. "PM(?:CB|LL)(.)"
+_PATTERN_RE: Final = re.compile(r"^(\w*)(?:\(\?:([\w|]+)\))?(.*)$")
+
+# Value tails that capture a fixed number of characters, e.g. "(..)"
+_FIXED_WIDTH_RE: Final = re.compile(r"^\((\.+)\)$")
+
+
+def _dash_collapse(val: str) -> str:
+    """Return value with spaces as dashes and runs of dashes collapsed."""
+    val = val.replace(" ", "-")
+    while "--" in val:
+        val = val.replace("--", "-")
+    return val
+
+
+def _build_table(fmt: list | dict, width: int) -> dict[str, str | None]:
+    """Return a lookup table for a fixed width list or dict formatter."""
+    if isinstance(fmt, dict):
+        return fmt
+    table: dict[str, str | None] = {}
+    for i, val in enumerate(fmt):
+        key = f"{i:0{width}X}"
+        table[key] = table[key.lower()] = val
+    return table
+
+
+def _index_formatters(
+    formatters: dict[str, Formatter],
+) -> dict[str, tuple[str, Formatter]]:
+    """Return formatter value tails keyed by the opcode they apply to."""
+    index: dict[str, tuple[str, Formatter]] = {}
+    for pat, fmt in formatters.items():
+        m = _PATTERN_RE.match(pat)
+        assert m, f"unsupported formatter pattern '{pat}'"
+        for alt in m[2].split("|") if m[2] else [""]:
+            # First matching formatter wins, same as a linear scan would
+            index.setdefault(m[1] + alt, (m[3], fmt))
+    return index
+
+
+def _build_decoder(tail: str, fmt: Formatter) -> Decoder:
+    """Return a decoder for a formatter value tail.
+
+    Fixed width list and dict formatters resolve to a lookup table keyed by
+    the raw value, everything else to a compiled regex of the value tail
+    and its callable.
+    """
+    fixed = _FIXED_WIDTH_RE.match(tail)
+    if fixed and isinstance(fmt, list | dict):
+        width = len(fixed[1])
+        return (width, _build_table(fmt, width))
+    assert callable(fmt), f"unsupported formatter for '{tail}'"
+    return (re.compile(r"^" + tail + r"$"), fmt)
+
 
 class JvcCommand:
     """Class for representing a JVC Projector command."""
 
     def __init__(self, code: str, is_ref=False):
         """Initialize class."""
+        if len(code) < 2:
+            raise JvcProjectorCommandError(f"Command code '{code}' too short")
         self.code = code
+        self.code_bytes = code.encode("ascii")
         self.is_ref = is_ref
         self.ack = False
         self._response: str | None = None
@@ -53,48 +119,59 @@ class JvcCommand:
         if not self.is_ref or self._response is None:
             return None
 
-        res = self.code + self._response
-        val: str = res[len(self.code) :]
+        val = self._response
 
-        for pat, fmt in self.formatters.items():
-            m = re.search(r"^" + pat + r"$", res)
-            if m:
-                if isinstance(fmt, list):
-                    try:
-                        return fmt[int(m[1], 16)]
-                    except ValueError:
-                        msg = "response '%s' not int for cmd '%s'"
-                        _LOGGER.warning(msg, val, self.code)
-                    except KeyError:
-                        msg = "response '%s' not mapped for cmd '%s'"
-                        _LOGGER.warning(msg, val, self.code)
-                elif isinstance(fmt, dict):
+        entry = self._decoder(self.code)
+        if entry:
+            if isinstance(entry[0], int):
+                width, table = entry
+                if len(val) == width:
                     try:
-                        return fmt[m[1]]
+                        return table[val]
                     except KeyError:
                         msg = "response '%s' not mapped for cmd '%s'"
                         _LOGGER.warning(msg, val, self.code)
-                elif callable(fmt):
+            else:
+                rx, func = entry
+                m = rx.match(val)
+                if m:
                     try:
-                        return fmt(m)
+                        return func(m)
                     except Exception as e:  # noqa: BLE001
                         msg = "response format failed with %s for '%s (%s)'"
                         _LOGGER.warning(msg, e, self.code, val)
-                break
 
         return val
 
     @response.setter
-    def response(self, data: str) -> None:
+    def response(self, data: str | None) -> None:
         """Set command response."""
         self._response = data
 
+    @classmethod
+    @functools.cache
+    def _formatter_index(cls) -> dict[str, tuple[str, Formatter]]:
+        """Return formatter value tails keyed by opcode, built on first use."""
+        return _index_formatters(cls.formatters)
+
+    @classmethod
+    @functools.cache
+    def _decoder(cls, code: str) -> Decoder | None:
+        """Return the decoder for an opcode, built on first use."""
+        entry = cls._formatter_index().get(code)
+        return _build_decoder(*entry) if entry else None
+
+    @functools.cached_property
+    def frame(self) -> bytes:
+        """Return command encoded for sending to the device."""
+        return (HEAD_REF if self.is_ref else HEAD_OP) + self.code_bytes + END
+
     @property
     def is_power(self) -> bool:
         """Return if command is a power command."""
         return self.code.startswith("PW")
 
-    formatters: dict[str, list | dict | Callable] = {
+    formatters: dict[str, Formatter] = {
         # Power
         "PW(.)": [const.STANDBY, const.ON, const.COOLING, const.WARMING, const.ERROR],
         # Input
@@ -109,7 +186,7 @@ class JvcCommand:
         # Source
         "SC(.)": [const.NOSIGNAL, const.SIGNAL],
         # Model
-        "MD(.+)": lambda r: re.sub(r"-+", "-", r[1].replace(" ", "-")),
+        "MD(.+)": lambda r: _dash_collapse(r[1]),
         # Picture Mode
         "PMPM(..)": {
             "00": "film",
@@ -357,6 +434,6 @@ class JvcCommand:
         "PMNP(.)": ["-", "start"],
         # Lan Setup
         "LSDS(.)": [const.OFF, const.ON],
-        "LSMA(.+)": lambda r: re.sub(r"-+", "-", r[1].replace(" ", "-")),
-        "LSIP(..)(..)(..)(..)": lambda r: f"{int(r[1], 16)}.{int(r[2], 16)}.{int(r[3], 16)}.{int(r[4], 16)}",
+        "LSMA(.+)": lambda r: _dash_collapse(r[1]),
+        "LSIP(..)(..)(..)(..)": lambda r: ".".join(map(str, bytes.fromhex(r[0]))),
     }
@@ -6,16 +6,12 @@ import asyncio
 from hashlib import sha256
 import logging
 import struct
-from time import time
 
 from . import const
 from .command import (
     AUTH_SALT,
-    END,
     HEAD_ACK,
     HEAD_LEN,
-    HEAD_OP,
-    HEAD_REF,
     HEAD_RES,
     PJACK,
     PJNAK,
@@ -32,9 +28,12 @@ from .error import (
 )
 
 KEEPALIVE_TTL = 2
+SEND_INTERVAL = 0.5
 
 _LOGGER = logging.getLogger(__name__)
 
+_AUTH_SALT_BYTES = AUTH_SALT.encode()
+
 
 class JvcDevice:
     """Class for representing a JVC Projector device."""
@@ -52,10 +51,24 @@ class JvcDevice:
         self._lock = asyncio.Lock()
         self._keepalive: asyncio.Task | None = None
         self._last: float = 0.0
+        self._next_send_at: float = 0.0
 
     async def send(self, cmds: list[JvcCommand]) -> None:
         """Send commands to device."""
+        await self._send_cmds(cmds, False)
+
+    async def send_pipelined(self, cmds: list[JvcCommand]) -> None:
+        """Send commands to device back to back, then read their responses."""
+        await self._send_cmds(cmds, True)
+
+    async def _send_cmds(self, cmds: list[JvcCommand], pipelined: bool) -> None:
+        """Send commands to device, optionally pipelined."""
         async with self._lock:
+            # Commands may be reused, so clear results of any previous send
+            for c in cmds:
+                c.ack = False
+                c.response = None
+
             # Treat status refreshes with special handling
             is_refresh = len(cmds) > 1 and cmds[0].is_ref and cmds[0].is_power
 
@@ -76,13 +89,22 @@ class JvcDevice:
 
                 cmd = None
 
-                for cmd in cmds:
-                    await self._send(cmd)
-                    # Throttle since some projectors dont like back to back commands
-                    await asyncio.sleep(0.5)
-                    # If device is not powered on, skip remaining commands
-                    if is_refresh and cmds[0].response != const.ON:
-                        break
+                if pipelined:
+                    pending = cmds
+                    if is_refresh:
+                        # Confirm power before pipelining remaining commands
+                        cmd = cmds[0]
+                        await self._send(cmd)
+                        pending = cmds[1:] if cmd.response == const.ON else []
+                    if pending:
+                        await self._send_pipelined(pending)
+                        cmd = pending[-1]
+                else:
+                    for cmd in cmds:
+                        await self._send(cmd)
+                        # If device is not powered on, skip remaining commands
+                        if is_refresh and cmds[0].response != const.ON:
+                            break
             except Exception:
                 keepalive = False
                 raise
@@ -99,7 +121,8 @@ class JvcDevice:
         """Connect to device."""
         assert not self._conn.is_connected()
 
-        elapsed = time() - self._last
+        loop = asyncio.get_running_loop()
+        elapsed = loop.time() - self._last
         if elapsed < 0.75:
             await asyncio.sleep(0.75 - elapsed)
 
@@ -148,11 +171,7 @@ class JvcDevice:
 
             if data == PJNAK:
                 _LOGGER.debug("Standard auth failed, trying SHA256 auth")
-                auth = (
-                    sha256(f"{self._auth.decode()}{AUTH_SALT}".encode())
-                    .hexdigest()
-                    .encode()
-                )
+                auth = sha256(self._auth + _AUTH_SALT_BYTES).hexdigest().encode("ascii")
                 await self._conn.write(PJREQ + b"_" + auth)
                 data = await self._conn.read(len(PJACK))
                 if data == PJACK:
@@ -167,21 +186,56 @@ class JvcDevice:
         except asyncio.TimeoutError as err:
             raise JvcProjectorConnectError("Handshake ack timeout") from err
 
-        self._last = time()
+        self._last = loop.time()
 
     async def _send(self, cmd: JvcCommand) -> None:
         """Send command to device."""
+        await self._throttle()
+        await self._write(cmd)
+        await self._read(cmd)
+        self._next_send_at = asyncio.get_running_loop().time() + SEND_INTERVAL
+
+    async def _send_pipelined(self, cmds: list[JvcCommand]) -> None:
+        """Send commands to device in one write, then read each response."""
         assert self._conn.is_connected()
-        assert len(cmd.code) >= 2
 
-        code = cmd.code.encode()
-        data = (HEAD_REF if cmd.is_ref else HEAD_OP) + code + END
+        await self._throttle()
+
+        data = b"".join(cmd.frame for cmd in cmds)
+        _LOGGER.debug(
+            "Sending batch '%s (%s)'", ", ".join(cmd.code for cmd in cmds), data
+        )
+        await self._conn.write(data)
+
+        # Responses arrive in the order the commands were written
+        for cmd in cmds:
+            await self._read(cmd)
+        self._next_send_at = asyncio.get_running_loop().time() + SEND_INTERVAL
+
+    async def _throttle(self) -> None:
+        """Wait until the send interval since the last command has passed."""
+        # Throttle since some projectors dont like back to back commands
+        delay = self._next_send_at - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _write(self, cmd: JvcCommand) -> None:
+        """Write command to device."""
+        assert self._conn.is_connected()
+
+        data = cmd.frame
 
         _LOGGER.debug(
             "Sending %s '%s (%s)'", "ref" if cmd.is_ref else "op", cmd.code, data
         )
         await self._conn.write(data)
 
+    async def _read(self, cmd: JvcCommand) -> None:
+        """Read command ack and response from device."""
+        op2 = cmd.code_bytes[:2]
+        ack_prefix = HEAD_ACK + op2
+        res_prefix = HEAD_RES + op2
+
         try:
             data = await self._conn.readline()
         except asyncio.TimeoutError:
@@ -190,7 +244,7 @@ class JvcDevice:
 
         _LOGGER.debug("Received ack %s", data)
 
-        if not data.startswith(HEAD_ACK + code[0:2]):
+        if not data.startswith(ack_prefix):
             raise JvcProjectorCommandError(
                 f"Response ack invalid '{data!r}' for '{cmd.code}'"
             )
@@ -204,16 +258,15 @@ class JvcDevice:
 
             _LOGGER.debug("Received ref %s (%s)", data[HEAD_LEN + 2 : -1], data)
 
-            if not data.startswith(HEAD_RES + code[0:2]):
+            if not data.startswith(res_prefix):
                 raise JvcProjectorCommandError(
                     f"Ref ack invalid '{data!r}' for '{cmd.code}'"
                 )
 
-            try:
-                cmd.response = data[HEAD_LEN + 2 : -1].decode()
-            except UnicodeDecodeError:
-                cmd.response = data.hex()
-                _LOGGER.warning("Failed to decode response '%s'", data)
+            res = data[HEAD_LEN + 2 : -1]
+            if not res.isascii():
+                _LOGGER.debug("Received non-ascii response '%s'", data)
+            cmd.response = res.decode("latin-1")
 
         cmd.ack = True
 
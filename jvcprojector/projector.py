@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
-from . import command, const
-from .command import JvcCommand
+from .command import INPUT, MAC, MODEL, POWER, REMOTE, SOURCE, TEST, VERSION, JvcCommand
 from .connection import resolve
+from .const import NOSIGNAL, STANDBY
 from .device import JvcDevice
 from .error import JvcProjectorConnectError, JvcProjectorError
 
@@ -14,6 +16,29 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PORT = 20554
 DEFAULT_TIMEOUT = 15.0
+STANDBY_TTL = 10.0
+
+# Suggested poll intervals as (seconds since last operation, interval)
+POLL_HINTS = ((10.0, 0.5), (60.0, 5.0))
+POLL_IDLE = 30.0
+
+# Seconds between polls while waiting for a state change
+WAIT_INTERVAL = 0.5
+
+_STATE_COMMANDS = {
+    "power": POWER,
+    "input": INPUT,
+    "source": SOURCE,
+}
+
+# Value reported for a state key when the device gave no response
+_STATE_DEFAULTS: dict[str, str | None] = {
+    "power": None,
+    "input": NOSIGNAL,
+    "source": NOSIGNAL,
+}
+
+_OPCODE_TO_KEY = {code: key for key, code in _STATE_COMMANDS.items()}
 
 
 class JvcProjector:
@@ -26,18 +51,25 @@ class JvcProjector:
         port: int = DEFAULT_PORT,
         timeout: float = DEFAULT_TIMEOUT,
         password: str | None = None,
+        pipeline: bool = False,
     ) -> None:
         """Initialize class."""
         self._host = host
         self._port = port
         self._timeout = timeout
         self._password = password
+        self._pipeline = pipeline
 
         self._device: JvcDevice | None = None
         self._ip: str = ""
         self._model: str = ""
         self._mac: str = ""
         self._version: str = ""
+        self._state: dict[str, str | None] = {}
+        self._last_poll: float = 0.0
+        self._last_power: str | None = None
+        self._last_op: float | None = None
+        self._commands: dict[tuple[str, bool], JvcCommand] = {}
 
     @property
     def ip(self) -> str:
@@ -102,8 +134,8 @@ class JvcProjector:
     async def get_info(self) -> dict[str, str]:
         """Get device info."""
         assert self._device
-        model = JvcCommand(command.MODEL, True)
-        mac = JvcCommand(command.MAC, True)
+        model = JvcCommand(MODEL, True)
+        mac = JvcCommand(MAC, True)
         await self._send([model, mac])
 
         if mac.response is None:
@@ -120,63 +152,121 @@ class JvcProjector:
     async def get_state(self) -> dict[str, str | None]:
         """Get device state."""
         assert self._device
-        pwr = JvcCommand(command.POWER, True)
-        inp = JvcCommand(command.INPUT, True)
-        src = JvcCommand(command.SOURCE, True)
-        res = await self._send([pwr, inp, src])
-        return {
-            "power": res[0] or None,
-            "input": res[1] or const.NOSIGNAL,
-            "source": res[2] or const.NOSIGNAL,
-        }
+
+        # Projector in standby changes state rarely, so skip recent re-polls
+        now = time.monotonic()
+        if self._last_power == STANDBY and now - self._last_poll < STANDBY_TTL:
+            return dict(self._state)
+
+        cmds = [self._command(code, True) for code in _STATE_COMMANDS.values()]
+        await self._send(cmds, pipelined=self._pipeline)
+
+        state: dict[str, str | None] = {}
+        for cmd in cmds:
+            key = _OPCODE_TO_KEY[cmd.code]
+            state[key] = cmd.response or _STATE_DEFAULTS[key]
+        self._state = state
+        self._last_power = state["power"]
+        self._last_poll = now
+        return dict(state)
+
+    def next_poll_hint(self) -> float:
+        """Return suggested seconds until the next state poll."""
+        if self._last_op is not None:
+            elapsed = time.monotonic() - self._last_op
+            for window, interval in POLL_HINTS:
+                if elapsed < window:
+                    return interval
+        return POLL_IDLE
+
+    async def wait_for_state(self, key: str, expected: str, timeout: float) -> bool:
+        """Poll a single state value until it matches expected or times out."""
+        if key not in _STATE_COMMANDS:
+            raise JvcProjectorError(f"Unknown state key '{key}'")
+
+        cmd = self._command(_STATE_COMMANDS[key], True)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                # Bound each poll too, since a send may reconnect and wait on reads
+                responses = await asyncio.wait_for(
+                    self._send([cmd]), deadline - time.monotonic()
+                )
+            except asyncio.TimeoutError:
+                return False
+            if (responses[0] or _STATE_DEFAULTS[key]) == expected:
+                return True
+            # Only sleep if the next poll still has time left to run
+            if deadline - time.monotonic() <= WAIT_INTERVAL:
+                return False
+            await asyncio.sleep(WAIT_INTERVAL)
 
     async def get_version(self) -> str | None:
         """Get device software version."""
-        return await self.ref(command.VERSION)
+        version = await self.ref(VERSION)
+        if version:
+            self._version = version
+        return version
 
     async def get_power(self) -> str | None:
         """Get power state."""
-        return await self.ref(command.POWER)
+        return await self.ref(POWER)
 
     async def get_input(self) -> str | None:
         """Get current input."""
-        return await self.ref(command.INPUT)
+        return await self.ref(INPUT)
 
     async def get_signal(self) -> str | None:
         """Get if has signal."""
-        return await self.ref(command.SOURCE)
+        return await self.ref(SOURCE)
 
     async def test(self) -> bool:
         """Run test command."""
-        cmd = JvcCommand(f"{command.TEST}")
+        cmd = JvcCommand(f"{TEST}")
         await self._send([cmd])
         return cmd.ack
 
     async def power_on(self) -> None:
         """Run power on command."""
-        await self.op(f"{command.POWER}1")
+        await self.op(f"{POWER}1")
 
     async def power_off(self) -> None:
         """Run power off command."""
-        await self.op(f"{command.POWER}0")
+        await self.op(f"{POWER}0")
 
     async def remote(self, code: str) -> None:
         """Run remote code command."""
-        await self.op(f"{command.REMOTE}{code}")
+        await self.op(f"{REMOTE}{code}")
 
     async def op(self, code: str) -> None:
         """Send operation code."""
+        # Operations may change state, so the next get_state must re-poll
+        self._last_power = None
+        self._last_op = time.monotonic()
         await self._send([JvcCommand(code, False)])
 
     async def ref(self, code: str) -> str | None:
         """Send reference code."""
         return (await self._send([JvcCommand(code, True)]))[0]
 
-    async def _send(self, cmds: list[JvcCommand]) -> list[str | None]:
+    def _command(self, code: str, is_ref: bool) -> JvcCommand:
+        """Return a reusable command for repeatedly polled codes."""
+        key = (code, is_ref)
+        cmd = self._commands.get(key)
+        if cmd is None:
+            cmd = self._commands[key] = JvcCommand(code, is_ref)
+        return cmd
+
+    async def _send(
+        self, cmds: list[JvcCommand], pipelined: bool = False
+    ) -> list[str | None]:
         """Send command to device."""
         if self._device is None:
             raise JvcProjectorError("Must call connect before sending commands")
 
-        await self._device.send(cmds)
+        if pipelined:
+            await self._device.send_pipelined(cmds)
+        else:
+            await self._device.send(cmds)
 
         return [cmd.response for cmd in cmds]
@@ -1,6 +1,9 @@
 """pytest tests."""
 
-from jvcprojector.device import END
+from collections import deque
+
+from jvcprojector import command
+from jvcprojector.command import END, HEAD_ACK
 
 IP = "127.0.0.1"
 HOST = "localhost"
@@ -8,9 +11,28 @@ PORT = 12345
 TIMEOUT = 3.0
 MAC = "abcd1234"
 MODEL = "model123"
+VERSION = "210PJ"
 PASSWORD = "pass1234"
 
 
 def cc(hdr: bytes, cmd: str):
     """Create a command."""
     return hdr + cmd.encode() + END
+
+
+ACK_POWER = cc(HEAD_ACK, command.POWER)
+
+
+def seq(*vals):
+    """Create a mock side effect returning vals in order."""
+    queue = deque(vals)
+
+    def side_effect(*args, **kwargs):
+        val = queue.popleft()
+        if isinstance(val, BaseException) or (
+            isinstance(val, type) and issubclass(val, BaseException)
+        ):
+            raise val
+        return val
+
+    return side_effect
@@ -2,76 +2,147 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from jvcprojector import command, const
 from jvcprojector.command import JvcCommand
-from jvcprojector.device import HEAD_ACK, PJACK, PJOK
+from jvcprojector.device import PJACK, PJOK, JvcDevice
+from jvcprojector.projector import JvcProjector
 
-from . import IP, MAC, MODEL, PORT, cc
+from . import ACK_POWER, IP, MAC, MODEL, PORT, TIMEOUT, VERSION, seq
+
+_SENTINEL = object()
+
+_DEV_DEFAULTS = {
+    command.TEST: None,
+    command.MAC: MAC,
+    command.MODEL: MODEL,
+    command.VERSION: VERSION,
+    command.POWER: const.ON,
+    command.INPUT: const.HDMI1,
+    command.SOURCE: const.SIGNAL,
+}
+
+
+def pytest_collection_modifyitems(items):
+    """Run all async tests in the session event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(name="conn_mock", scope="module")
+def fixture_mock_connection_class():
+    """Return a mocked connection class shared by a test module."""
+    patcher = patch("jvcprojector.device.JvcConnection", spec_set=True)
+    yield patcher.start()
+    patcher.stop()
 
 
 @pytest.fixture(name="conn")
-def fixture_mock_connection(request):
+def fixture_mock_connection(request, conn_mock):
     """Return a mocked connection."""
-    with patch("jvcprojector.device.JvcConnection", autospec=True) as mock:
+    connected = False
+
+    fixture = {"raise_on_connect": 0}
+
+    if hasattr(request, "param"):
+        fixture.update(request.param)
+
+    def connect():
+        nonlocal connected
+        if fixture["raise_on_connect"] > 0:
+            fixture["raise_on_connect"] -= 1
+            raise ConnectionRefusedError
+        connected = True
+
+    def disconnect():
+        nonlocal connected
         connected = False
 
-        fixture = {"raise_on_connect": 0}
+    conn = conn_mock.return_value
+    conn.reset_mock()
+    conn.ip = IP
+    conn.port = PORT
+    conn.is_connected.side_effect = lambda: connected
+    conn.connect.side_effect = connect
+    conn.disconnect.side_effect = disconnect
+    conn.read.side_effect = seq(PJOK, PJACK)
+    conn.readline.side_effect = seq(ACK_POWER)
+    conn.write.side_effect = lambda p: None
+
+    return conn
+
 
-        if hasattr(request, "param"):
-            fixture.update(request.param)
+@pytest.fixture(name="dev_state", scope="module")
+def fixture_mock_device_state():
+    """Return the command responses of the mocked device shared by a test module."""
+    return {}
 
-        def connect():
-            nonlocal connected
-            if fixture["raise_on_connect"] > 0:
-                fixture["raise_on_connect"] -= 1
-                raise ConnectionRefusedError
-            connected = True
 
-        def disconnect():
-            nonlocal connected
-            connected = False
+@pytest.fixture(name="dev_mock", scope="module")
+def fixture_mock_device_class(dev_state):
+    """Return a mocked device class shared by a test module."""
 
-        conn = mock.return_value
-        conn.ip = IP
-        conn.port = PORT
-        conn.is_connected.side_effect = lambda: connected
-        conn.connect.side_effect = connect
-        conn.disconnect.side_effect = disconnect
-        conn.read.side_effect = [PJOK, PJACK]
-        conn.readline.side_effect = [cc(HEAD_ACK, command.POWER)]
-        conn.write.side_effect = lambda p: None
+    state = MappingProxyType(dev_state)
 
-        yield conn
+    async def send(cmds: list[JvcCommand]):
+        for cmd in cmds:
+            cmd.ack = False
+            cmd.response = None
+            resp = state.get(cmd.code, _SENTINEL)
+            if resp is _SENTINEL:
+                continue
+            cmd.ack = True
+            if resp:
+                cmd.response = resp
+
+    async def disconnect():
+        pass
+
+    patcher = patch("jvcprojector.projector.JvcDevice", spec_set=True)
+    dev_mock = patcher.start()
+
+    # Plain mocks returning the side effect coroutines are cheaper than AsyncMock
+    dev = dev_mock.return_value
+    dev.send = MagicMock(side_effect=send)
+    dev.send_pipelined = MagicMock(side_effect=send)
+    dev.disconnect = MagicMock(side_effect=disconnect)
+
+    yield dev_mock
+    patcher.stop()
 
 
 @pytest.fixture(name="dev")
-def fixture_mock_device(request):
+def fixture_mock_device(request, dev_mock, dev_state):
     """Return a mocked device."""
-    with patch("jvcprojector.projector.JvcDevice", autospec=True) as mock:
-        fixture = {
-            command.TEST: None,
-            command.MAC: MAC,
-            command.MODEL: MODEL,
-            command.POWER: const.ON,
-            command.INPUT: const.HDMI1,
-            command.SOURCE: const.SIGNAL,
-        }
-
-        if hasattr(request, "param"):
-            fixture.update(request.param)
-
-        async def send(cmds: list[JvcCommand]):
-            for cmd in cmds:
-                if cmd.code in fixture:
-                    if fixture[cmd.code]:
-                        cmd.response = fixture[cmd.code]
-                    cmd.ack = True
-
-        dev = mock.return_value
-        dev.send.side_effect = send
-
-        yield dev
+    dev_state.clear()
+    dev_state.update(_DEV_DEFAULTS)
+
+    if hasattr(request, "param"):
+        dev_state.update(request.param)
+
+    dev = dev_mock.return_value
+    dev.reset_mock()
+
+    return dev
+
+
+@pytest.fixture(name="jvc_device")
+def fixture_device(conn):
+    """Return a device using the mocked connection."""
+    return JvcDevice(IP, PORT, TIMEOUT)
+
+
+@pytest_asyncio.fixture(name="jvc_projector")
+async def fixture_projector(dev):
+    """Return a connected projector using the mocked device."""
+    p = JvcProjector(IP)
+    await p.connect()
+    yield p
+    await p.disconnect()
@@ -0,0 +1,56 @@
+"""Tests for command module."""
+
+import pytest
+
+from jvcprojector import command, const
+from jvcprojector.command import HEAD_OP, HEAD_REF, JvcCommand
+from jvcprojector.error import JvcProjectorCommandError
+
+from . import cc
+
+
+@pytest.mark.parametrize(
+    ("code", "response", "expected"),
+    [
+        (command.POWER, "1", const.ON),
+        (command.POWER, "9", "9"),
+        ("FUTR", "C", "ins10"),
+        ("FUTR", "c", "ins10"),
+        (command.INPUT, "6", const.HDMI1),
+        ("IFIN", "7", const.HDMI2),
+        ("PMPM", "0B", "frameadapt_hdr"),
+        ("PMLL", "1", "on"),
+        ("INFN", "0", "stop"),
+        (command.MODEL, "ILAFPJ -- XHP1", "ILAFPJ-XHP1"),
+        (command.MAC, "E0 DA--DC ", "E0-DA-DC-"),
+        ("LSIP", "C0A80001", "192.168.0.1"),
+        ("PMPM", "FF", "FF"),
+        ("ZZZZ", "1", "1"),
+    ],
+)
+def test_response(code: str, response: str, expected: str):
+    """Test reference responses are formatted."""
+    cmd = JvcCommand(code, True)
+    cmd.response = response
+    assert cmd.response == expected
+
+
+def test_response_op():
+    """Test operation commands have no response."""
+    cmd = JvcCommand(f"{command.POWER}1")
+    cmd.response = "1"
+    assert cmd.response is None
+
+
+def test_frame():
+    """Test command frames are encoded once."""
+    cmd = JvcCommand(command.POWER, True)
+    assert cmd.frame == cc(HEAD_REF, command.POWER)
+    assert cmd.frame is cmd.frame
+    assert JvcCommand(f"{command.POWER}1").frame == cc(HEAD_OP, f"{command.POWER}1")
+
+
+def test_code_too_short():
+    """Test command with a code shorter than an opcode fails."""
+    with pytest.raises(JvcProjectorCommandError):
+        JvcCommand("P")
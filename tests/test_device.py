@@ -1,17 +1,16 @@
 """Tests for device module."""
 
+import asyncio
 from hashlib import sha256
-from unittest.mock import AsyncMock, call
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from jvcprojector import command, const
-from jvcprojector.command import JvcCommand
+from jvcprojector.command import HEAD_OP, HEAD_REF, JvcCommand
 from jvcprojector.device import (
     AUTH_SALT,
     HEAD_ACK,
-    HEAD_OP,
-    HEAD_REF,
     HEAD_RES,
     PJACK,
     PJNAK,
@@ -22,136 +21,192 @@ from jvcprojector.device import (
 )
 from jvcprojector.error import JvcProjectorCommandError
 
-from . import IP, PORT, TIMEOUT, cc
+from . import ACK_POWER, IP, PORT, TIMEOUT, cc, seq
 
+_OP_POWER_ON = cc(HEAD_OP, f"{command.POWER}1")
+_REF_POWER = cc(HEAD_REF, command.POWER)
+_RES_POWER_ON = cc(HEAD_RES, command.POWER + "1")
 
-@pytest.mark.asyncio
-async def test_send_op(conn: AsyncMock):
+# Short real send interval for throttle tests
+_SEND_INTERVAL = 0.1
+
+_EXPECTED_OP_POWER_ON = [PJREQ, _OP_POWER_ON]
+_EXPECTED_REF_POWER = [PJREQ, _REF_POWER]
+
+
+def _writes(conn: AsyncMock) -> list[bytes]:
+    """Return the data of each write to the mocked connection."""
+    return [c.args[0] for c in conn.write.call_args_list]
+
+
+async def test_send_op(conn: AsyncMock, jvc_device: JvcDevice):
     """Test send operation command succeeds."""
-    dev = JvcDevice(IP, PORT, TIMEOUT)
     cmd = JvcCommand(f"{command.POWER}1")
-    await dev.send([cmd])
-    await dev.disconnect()
+    await jvc_device.send([cmd])
+    await jvc_device.disconnect()
     assert cmd.ack
     assert cmd.response is None
     conn.connect.assert_called_once()
-    conn.write.assert_has_calls([call(PJREQ), call(cc(HEAD_OP, f"{command.POWER}1"))])
+    assert _writes(conn) == _EXPECTED_OP_POWER_ON
 
 
-@pytest.mark.asyncio
-async def test_send_ref(conn: AsyncMock):
+async def test_send_ref(conn: AsyncMock, jvc_device: JvcDevice):
     """Test send reference command succeeds."""
-    conn.readline.side_effect = [
-        cc(HEAD_ACK, command.POWER),
-        cc(HEAD_RES, command.POWER + "1"),
-    ]
-    dev = JvcDevice(IP, PORT, TIMEOUT)
+    conn.readline.side_effect = seq(ACK_POWER, _RES_POWER_ON)
     cmd = JvcCommand(command.POWER, True)
-    await dev.send([cmd])
-    await dev.disconnect()
+    await jvc_device.send([cmd])
+    await jvc_device.disconnect()
     assert cmd.ack
     assert cmd.response == const.ON
     conn.connect.assert_called_once()
-    conn.write.assert_has_calls([call(PJREQ), call(cc(HEAD_REF, command.POWER))])
+    assert _writes(conn) == _EXPECTED_REF_POWER
 
 
-@pytest.mark.asyncio
-async def test_send_with_password8(conn: AsyncMock):
-    """Test send with 8 character password succeeds."""
-    dev = JvcDevice(IP, PORT, TIMEOUT, "passwd78")
-    cmd = JvcCommand(f"{command.POWER}1")
-    await dev.send([cmd])
-    await dev.disconnect()
-    conn.write.assert_has_calls(
-        [call(PJREQ + b"_passwd78\x00\x00"), call(cc(HEAD_OP, f"{command.POWER}1"))]
-    )
-
-
-@pytest.mark.asyncio
-async def test_send_with_password10(conn: AsyncMock):
-    """Test send with 10 character password succeeds."""
-    dev = JvcDevice(IP, PORT, TIMEOUT, "passwd7890")
+@pytest.mark.parametrize(
+    ("password", "auth"),
+    [
+        ("passwd78", PJREQ + b"_passwd78\x00\x00"),
+        ("passwd7890", PJREQ + b"_passwd7890"),
+    ],
+)
+async def test_send_with_password(conn: AsyncMock, password: str, auth: bytes):
+    """Test send with 8 and 10 character passwords succeeds."""
+    dev = JvcDevice(IP, PORT, TIMEOUT, password)
     cmd = JvcCommand(f"{command.POWER}1")
     await dev.send([cmd])
     await dev.disconnect()
-    conn.write.assert_has_calls(
-        [call(PJREQ + b"_passwd7890"), call(cc(HEAD_OP, f"{command.POWER}1"))]
-    )
+    assert _writes(conn) == [auth, _OP_POWER_ON]
 
 
-@pytest.mark.asyncio
 async def test_send_with_password_sha256(conn: AsyncMock):
     """Test send with a projector requiring sha256 hashing."""
-    conn.read.side_effect = [PJOK, PJNAK, PJACK]
+    conn.read.side_effect = seq(PJOK, PJNAK, PJACK)
     dev = JvcDevice(IP, PORT, TIMEOUT, "passwd78901")
     cmd = JvcCommand(f"{command.POWER}1")
     await dev.send([cmd])
     await dev.disconnect()
     auth = sha256(f"passwd78901{AUTH_SALT}".encode()).hexdigest().encode()
-    conn.write.assert_has_calls(
-        [call(PJREQ + b"_" + auth), call(cc(HEAD_OP, f"{command.POWER}1"))]
-    )
+    assert _writes(conn) == [
+        PJREQ + b"_passwd78901",
+        PJREQ + b"_" + auth,
+        _OP_POWER_ON,
+    ]
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("conn", [{"raise_on_connect": 1}], indirect=True)
-async def test_connection_refused_retry(conn: AsyncMock):
+async def test_connection_refused_retry(conn: AsyncMock, jvc_device: JvcDevice):
     """Test connection refused results in retry."""
-    dev = JvcDevice(IP, PORT, TIMEOUT)
     cmd = JvcCommand(f"{command.POWER}1")
-    await dev.send([cmd])
-    await dev.disconnect()
+    await jvc_device.send([cmd])
+    await jvc_device.disconnect()
     assert cmd.ack
     assert conn.connect.call_count == 2
-    conn.write.assert_has_calls([call(PJREQ), call(cc(HEAD_OP, f"{command.POWER}1"))])
+    assert _writes(conn) == _EXPECTED_OP_POWER_ON
 
 
-@pytest.mark.asyncio
-async def test_connection_busy_retry(conn: AsyncMock):
+async def test_connection_busy_retry(conn: AsyncMock, jvc_device: JvcDevice):
     """Test handshake busy results in retry."""
-    conn.read.side_effect = [PJNG, PJOK, PJACK]
-    dev = JvcDevice(IP, PORT, TIMEOUT)
+    conn.read.side_effect = seq(PJNG, PJOK, PJACK)
     cmd = JvcCommand(f"{command.POWER}1")
-    await dev.send([cmd])
-    await dev.disconnect()
+    await jvc_device.send([cmd])
+    await jvc_device.disconnect()
     assert conn.connect.call_count == 2
-    conn.write.assert_has_calls([call(PJREQ), call(cc(HEAD_OP, f"{command.POWER}1"))])
+    assert _writes(conn) == _EXPECTED_OP_POWER_ON
 
 
-@pytest.mark.asyncio
-async def test_connection_bad_handshake_error(conn: AsyncMock):
+async def test_connection_bad_handshake_error(conn: AsyncMock, jvc_device: JvcDevice):
     """Test bad handshake results in error."""
-    conn.read.side_effect = [b"BAD"]
-    dev = JvcDevice(IP, PORT, TIMEOUT)
+    conn.read.side_effect = seq(b"BAD")
     cmd = JvcCommand(f"{command.POWER}1")
     with pytest.raises(JvcProjectorCommandError):
-        await dev.send([cmd])
+        await jvc_device.send([cmd])
     conn.connect.assert_called_once()
     conn.disconnect.assert_called_once()
     assert not cmd.ack
 
 
-@pytest.mark.asyncio
-async def test_send_op_bad_ack_error(conn: AsyncMock):
+async def test_send_op_bad_ack_error(conn: AsyncMock, jvc_device: JvcDevice):
     """Test send operation with bad ack results in error."""
-    conn.readline.side_effect = [cc(HEAD_ACK, "ZZ")]
-    dev = JvcDevice(IP, PORT, TIMEOUT)
+    conn.readline.side_effect = seq(cc(HEAD_ACK, "ZZ"))
     cmd = JvcCommand(f"{command.POWER}1")
     with pytest.raises(JvcProjectorCommandError):
-        await dev.send([cmd])
+        await jvc_device.send([cmd])
     conn.connect.assert_called_once()
     conn.disconnect.assert_called_once()
     assert not cmd.ack
 
 
-@pytest.mark.asyncio
-async def test_send_ref_bad_ack_error(conn: AsyncMock):
+async def test_send_ref_bad_ack_error(conn: AsyncMock, jvc_device: JvcDevice):
     """Test send reference with bad ack results in error."""
-    conn.readline.side_effect = [cc(HEAD_ACK, command.POWER), cc(HEAD_RES, "ZZ1")]
-    dev = JvcDevice(IP, PORT, TIMEOUT)
+    conn.readline.side_effect = seq(ACK_POWER, cc(HEAD_RES, "ZZ1"))
     cmd = JvcCommand(command.POWER, True)
     with pytest.raises(JvcProjectorCommandError):
-        await dev.send([cmd])
+        await jvc_device.send([cmd])
     conn.connect.assert_called_once()
     conn.disconnect.assert_called_once()
     assert not cmd.ack
+
+
+async def test_send_pipelined_refresh(conn: AsyncMock, jvc_device: JvcDevice):
+    """Test pipelined refresh writes remaining commands in one write."""
+    conn.readline.side_effect = seq(
+        ACK_POWER,
+        _RES_POWER_ON,
+        cc(HEAD_ACK, command.INPUT),
+        cc(HEAD_RES, command.INPUT + "6"),
+        cc(HEAD_ACK, command.SOURCE),
+        cc(HEAD_RES, command.SOURCE + "1"),
+    )
+    cmds = [
+        JvcCommand(command.POWER, True),
+        JvcCommand(command.INPUT, True),
+        JvcCommand(command.SOURCE, True),
+    ]
+    await jvc_device.send_pipelined(cmds)
+    await jvc_device.disconnect()
+    assert [cmd.response for cmd in cmds] == [const.ON, const.HDMI1, const.SIGNAL]
+    assert _writes(conn) == [
+        PJREQ,
+        _REF_POWER,
+        cc(HEAD_REF, command.INPUT) + cc(HEAD_REF, command.SOURCE),
+    ]
+
+
+async def test_send_pipelined_refresh_standby(conn: AsyncMock, jvc_device: JvcDevice):
+    """Test pipelined refresh skips remaining commands when not powered on."""
+    conn.readline.side_effect = seq(ACK_POWER, cc(HEAD_RES, command.POWER + "0"))
+    cmds = [JvcCommand(command.POWER, True), JvcCommand(command.INPUT, True)]
+    await jvc_device.send_pipelined(cmds)
+    await jvc_device.disconnect()
+    assert cmds[0].response == const.STANDBY
+    assert not cmds[1].ack
+    assert conn.write.call_count == 2
+
+
+async def test_send_reused_command_resets(conn: AsyncMock, jvc_device: JvcDevice):
+    """Test resending a command clears its previous result."""
+    conn.readline.side_effect = seq(ACK_POWER, _RES_POWER_ON, asyncio.TimeoutError)
+    cmd = JvcCommand(command.POWER, True)
+    await jvc_device.send([cmd])
+    assert cmd.response == const.ON
+    await jvc_device.send([cmd])
+    await jvc_device.disconnect()
+    assert not cmd.ack
+    assert cmd.response is None
+
+
+async def test_send_throttle(conn: AsyncMock, jvc_device: JvcDevice):
+    """Test sends wait only for the remainder of the send interval."""
+    conn.readline.side_effect = seq(ACK_POWER, ACK_POWER, ACK_POWER)
+    loop = asyncio.get_running_loop()
+    with patch("jvcprojector.device.SEND_INTERVAL", _SEND_INTERVAL):
+        start = loop.time()
+        await jvc_device.send([JvcCommand(f"{command.POWER}1")] * 2)
+        assert loop.time() - start > _SEND_INTERVAL / 2
+
+        await asyncio.sleep(_SEND_INTERVAL)
+        start = loop.time()
+        await jvc_device.send([JvcCommand(f"{command.POWER}1")])
+        assert loop.time() - start < _SEND_INTERVAL / 2
+    await jvc_device.disconnect()
+    assert conn.write.call_count == 4
@@ -1,17 +1,18 @@
 """Tests for projector module."""
 
-from unittest.mock import AsyncMock
+import asyncio
+import inspect
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from jvcprojector import command, const
 from jvcprojector.error import JvcProjectorError
-from jvcprojector.projector import JvcProjector
+from jvcprojector.projector import POLL_HINTS, POLL_IDLE, JvcProjector
 
-from . import HOST, IP, MAC, MODEL, PORT
+from . import HOST, IP, MAC, MODEL, PORT, VERSION
 
 
-@pytest.mark.asyncio
 async def test_init(dev: AsyncMock):
     """Test init succeeds."""
     p = JvcProjector(IP, port=PORT)
@@ -25,7 +26,6 @@ async def test_init(dev: AsyncMock):
         assert p.mac
 
 
-@pytest.mark.asyncio
 async def test_connect(dev: AsyncMock):
     """Test connect succeeds."""
     p = JvcProjector(IP, port=PORT)
@@ -35,7 +35,6 @@ async def test_connect(dev: AsyncMock):
     assert dev.disconnect.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_connect_host(dev: AsyncMock):
     """Test connect succeeds."""
     p = JvcProjector(HOST, port=PORT)
@@ -45,42 +44,132 @@ async def test_connect_host(dev: AsyncMock):
     assert dev.disconnect.call_count == 1
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("dev", [{command.MODEL: None}], indirect=True)
-async def test_unknown_model(dev: AsyncMock):
+async def test_unknown_model(dev: AsyncMock, jvc_projector: JvcProjector):
     """Test projector with unknown model succeeds."""
-    p = JvcProjector(IP)
-    await p.connect()
-    await p.get_info()
-    assert p.mac == MAC
-    assert p.model == "(unknown)"
+    await jvc_projector.get_info()
+    assert jvc_projector.mac == MAC
+    assert jvc_projector.model == "(unknown)"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("dev", [{command.MAC: None}], indirect=True)
-async def test_unknown_mac(dev: AsyncMock):
+async def test_unknown_mac(dev: AsyncMock, jvc_projector: JvcProjector):
     """Test projector with unknown mac uses model succeeds."""
-    p = JvcProjector(IP)
-    await p.connect()
     with pytest.raises(JvcProjectorError):
-        await p.get_info()
+        await jvc_projector.get_info()
 
 
-@pytest.mark.asyncio
-async def test_get_info(dev: AsyncMock):
+async def test_get_info(dev: AsyncMock, jvc_projector: JvcProjector):
     """Test get_info succeeds."""
+    assert await jvc_projector.get_info() == {"model": MODEL, "mac": MAC}
+
+
+async def test_get_power_input_signal(dev: AsyncMock, jvc_projector: JvcProjector):
+    """Test single state getters succeed."""
+    assert await jvc_projector.get_power() == const.ON
+    assert await jvc_projector.get_input() == const.HDMI1
+    assert await jvc_projector.get_signal() == const.SIGNAL
+
+
+def test_helpers_are_coroutine_functions():
+    """Test convenience helpers stay coroutine functions for typed callers."""
     p = JvcProjector(IP)
-    await p.connect()
-    assert await p.get_info() == {"model": MODEL, "mac": MAC}
+    for name in (
+        "get_power",
+        "get_input",
+        "get_signal",
+        "power_on",
+        "power_off",
+        "remote",
+    ):
+        assert inspect.iscoroutinefunction(getattr(p, name))
+
+
+async def test_get_version(dev: AsyncMock, jvc_projector: JvcProjector):
+    """Test get_version succeeds and caches version."""
+    with pytest.raises(JvcProjectorError):
+        assert jvc_projector.version
+    assert await jvc_projector.get_version() == VERSION
+    assert jvc_projector.version == VERSION
 
 
-@pytest.mark.asyncio
-async def test_get_state(dev: AsyncMock):
+async def test_get_state(dev: AsyncMock, jvc_projector: JvcProjector):
     """Test get_state succeeds."""
-    p = JvcProjector(IP)
+    dev.reset_mock()
+    assert await jvc_projector.get_state() == {
+        "power": const.ON,
+        "input": const.HDMI1,
+        "source": const.SIGNAL,
+    }
+    dev.send.assert_called_once()
+    dev.send_pipelined.assert_not_called()
+
+
+async def test_get_state_pipeline(dev: AsyncMock):
+    """Test get_state pipelines the refresh when enabled."""
+    p = JvcProjector(IP, pipeline=True)
     await p.connect()
     assert await p.get_state() == {
         "power": const.ON,
         "input": const.HDMI1,
         "source": const.SIGNAL,
     }
+    dev.send_pipelined.assert_called_once()
+    await p.disconnect()
+
+
+@pytest.mark.parametrize("dev", [{command.POWER: const.STANDBY}], indirect=True)
+async def test_get_state_standby_cached(dev: AsyncMock, jvc_projector: JvcProjector):
+    """Test get_state skips re-polls while in standby until an operation."""
+    dev.reset_mock()
+    state = await jvc_projector.get_state()
+    assert state["power"] == const.STANDBY
+    assert await jvc_projector.get_state() == state
+    assert dev.send.call_count == 1
+    await jvc_projector.power_on()
+    await jvc_projector.get_state()
+    assert dev.send.call_count == 3
+
+
+async def test_next_poll_hint(dev: AsyncMock, jvc_projector: JvcProjector):
+    """Test poll hint is short right after an operation."""
+    assert jvc_projector.next_poll_hint() == POLL_IDLE
+    await jvc_projector.power_on()
+    assert jvc_projector.next_poll_hint() == POLL_HINTS[0][1]
+
+
+async def test_wait_for_state(dev: AsyncMock, jvc_projector: JvcProjector):
+    """Test wait_for_state polls until expected value or timeout."""
+    assert await jvc_projector.wait_for_state("power", const.ON, 1.0)
+    assert not await jvc_projector.wait_for_state("power", const.STANDBY, 0.1)
+    with pytest.raises(JvcProjectorError):
+        await jvc_projector.wait_for_state("bogus", const.ON, 1.0)
+
+
+@pytest.mark.parametrize("dev", [{command.POWER: const.STANDBY}], indirect=True)
+async def test_wait_for_state_change(
+    dev: AsyncMock, dev_state: dict, jvc_projector: JvcProjector
+):
+    """Test wait_for_state sees a value change partway through the wait."""
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.3, dev_state.__setitem__, command.POWER, const.ON)
+    start = loop.time()
+    assert await jvc_projector.wait_for_state("power", const.ON, 2.0)
+    assert loop.time() - start < 2.0
+    assert dev.send.call_count > 2
+
+
+@pytest.mark.parametrize("dev", [{command.SOURCE: None}], indirect=True)
+async def test_wait_for_state_default(dev: AsyncMock, jvc_projector: JvcProjector):
+    """Test wait_for_state matches the default reported for no response."""
+    assert await jvc_projector.wait_for_state("source", const.NOSIGNAL, 1.0)
+
+
+async def test_wait_for_state_send_timeout(dev: AsyncMock, jvc_projector: JvcProjector):
+    """Test wait_for_state timeout also bounds a send in progress."""
+
+    async def send(cmds):
+        await asyncio.sleep(10)
+
+    with patch.object(dev.send, "side_effect", send):
+        assert not await jvc_projector.wait_for_state("power", const.ON, 0.1)